@@ -3,9 +3,10 @@ Implementation of a binomial heap data structure.
 
 Operation    | Running time
 -------------|---------------------
-minimum      | O(log n) worst case
+minimum      | O(1)
 union        | O(log max(n1, n2))
-insert       | O(log n)
+insert       | O(1) amortized, O(log n) worst case
+from_iterable| O(n)
 extract_min  | O(log n)
 decrease_key | O(log n) worst case
 remove       | O(log n)
@@ -34,6 +35,9 @@ class BinomialHeap:
 
         Uses leftmost child - next sibling representation.
         """
+
+        __slots__ = ('x', 'lchild', 'rsib', 'parent')
+
         def __init__(self, x, lchild=None, rsib=None, parent=None):
             """Constructor, client code should use directly only for 0th order tree"""
             self.x = x
@@ -74,7 +78,10 @@ class BinomialHeap:
 
             for t in trees:
                 t.parent = None
+                t.rsib = None
 
+            # children are linked from highest order to lowest.
+            trees.reverse()
             return self.x, trees
 
         def __iter__(self):
@@ -93,12 +100,14 @@ class BinomialHeap:
 
             In order to restore the min-heap property, the node's value is switched with
                 its parent's until the latter has a smaller value than x.
+            Returns the node x ends up in.
             """
 
             node.x = x
             while node.parent is not None and node.x < node.parent.x:
                 node.x, node.parent.x = node.parent.x, node.x
                 node = node.parent
+            return node
 
     @staticmethod
     def _safe_merge(t1, t2, i):
@@ -118,17 +127,38 @@ class BinomialHeap:
             self._trees = []
         else:
             self._trees = trees
+        self._find_min()
 
-    def minimum(self):
-        """Return the minimum element in the heap.
+    @classmethod
+    def from_iterable(cls, xs):
+        """Build a heap containing the elements of xs.
+
+        Each insert is O(1) amortized, so this takes O(n) time overall.
+        """
+
+        heap = cls()
+        for x in xs:
+            heap.insert(x)
+        return heap
+
+    def _find_min(self):
+        """Point self._min to the root with the minimum element.
 
         Since each binomial tree has the min-heap property, the minimum element must be
             one of the roots.
         """
 
         # filter None trees
-        trees = filter(lambda x: x is not None, self._trees)
-        return min(trees, key=lambda t: t.x).x
+        trees = [ t for t in self._trees if t is not None ]
+        self._min = min(trees, key=lambda t: t.x) if trees else None
+
+    def minimum(self):
+        """Return the minimum element in the heap.
+
+        A pointer to the root holding the minimum is kept up to date by every operation.
+        """
+
+        return self._min.x
 
     def union(self, other):
         """Heap merge operation. Most other heap operations use this.
@@ -172,12 +202,33 @@ class BinomialHeap:
             trees.pop()
 
         self._trees = trees
+        self._find_min()
 
     def insert(self, x):
-        """Insert x into the heap."""
+        """Insert x into the heap.
 
-        n_heap = type(self)([ self._BinomialTree(x) ])
-        self.union(n_heap)
+        This works like incrementing a binary counter.
+        The new order 0 tree is merged with the existing trees of order 0, 1, ...
+            until an order with no tree is found, where the result is placed.
+        Each merge removes a tree from the heap, which pays for it,
+            so insertion takes O(1) amortized time.
+        """
+
+        carry = self._BinomialTree(x)
+        i = 0
+        while i < len(self._trees) and self._trees[i] is not None:
+            carry = self._trees[i].merge(carry)
+            self._trees[i] = None
+            i += 1
+
+        if i == len(self._trees):
+            self._trees.append(carry)
+        else:
+            self._trees[i] = carry
+
+        # if the old minimum root was merged, carry holds the same value.
+        if self._min is None or not self._min.x < carry.x:
+            self._min = carry
 
     def extract_min(self):
         """Extract the minimum element from the heap.
@@ -187,14 +238,10 @@ class BinomialHeap:
         These are used to build a new heap, which is re-merged with the old one.
         """
 
-        min_i, min_t = 0, self._trees[0]
-        for i, t in enumerate(self._trees):
-            if t is None:
-                pass
-            elif min_t is None:
-                min_i, min_t = i, t
-            elif t.x < min_t.x:
-                min_i, min_t = i, t
+        # a tree of order p sits at index p, and its root has p children.
+        min_i, child = 0, self._min.lchild
+        while child is not None:
+            min_i, child = min_i + 1, child.rsib
 
         # split the tree containing minimum element
         min_elem, n_trees = self._trees[min_i].split()
@@ -206,15 +253,16 @@ class BinomialHeap:
 
         return min_elem
 
-    @classmethod
-    def decrease_key(cls, node, x):
+    def decrease_key(self, node, x):
         """Decrease the key contained in node to x.
 
         This assumes that the client code has a pointer into a tree in the heap (node).
         Not great for encapsulation, but only efficient way to support this operation.
         """
 
-        return cls._BinomialTree.decrease_key(node, x)
+        node = self._BinomialTree.decrease_key(node, x)
+        if node.parent is None and node.x < self._min.x:
+            self._min = node
 
     def remove(self, node):
         """Removes node from the heap.
@@ -228,7 +276,7 @@ class BinomialHeap:
         It is then extracted from the heap using extract_min().
         """
 
-        type(self).decrease_key(node, self.minimum()-1)
+        self.decrease_key(node, self.minimum()-1)
         self.extract_min()
 
     def __repr__(self):
@@ -0,0 +1,137 @@
+"""
+Implementation of a persistent (immutable) leftist heap.
+
+Operation    | Running time
+-------------|---------------------
+minimum      | O(1)
+union        | O(log n1 + log n2) worst case
+insert       | O(log n) worst case
+extract_min  | O(log n) worst case
+snapshot     | O(1)
+
+No operation modifies a heap, instead a new version of the heap is returned.
+Old versions share all unchanged nodes with new ones, so keeping a snapshot of
+    a heap is just keeping a reference to it.
+
+Doctests:
+
+>>> x = LeftistHeap()
+>>> vals = [35, 96, 98, 45, 33, 79, 26, 39, 99, 20, 56, 46]
+>>> for i in vals:
+...    x = x.insert(i)
+...
+>>> snapshot = x
+>>> m, x = x.extract_min()
+>>> m, x.minimum(), snapshot.minimum()
+(20, 26, 20)
+>>> len(x), len(snapshot)
+(11, 12)
+
+"""
+
+
+class LeftistHeap:
+    """Implementation of a persistent leftist heap.
+
+    The key is the value stored in the node.
+    """
+
+    class _Node:
+        """Immutable node used by the heap data structure.
+
+        The rank of a node is the length of the shortest path from it to a missing child.
+        In a leftist heap the left child's rank is never smaller than the right child's,
+            so the right spine of a heap with n nodes has O(log n) nodes.
+        """
+
+        __slots__ = ('x', 'rank', 'l', 'r')
+
+        def __init__(self, x, l=None, r=None):
+            self.x = x
+            self.l, self.r = l, r
+            self.rank = 1 + (r.rank if r is not None else 0)
+
+        @classmethod
+        def union(cls, a, b):
+            """Non-destructive, recursive union algorithm central to this heap implementation.
+
+            The root with the smaller value becomes the new root,
+                and the other heap is merged into its right child.
+            Children are swapped where needed to keep the leftist property.
+            Only nodes on the right spines of a and b are copied,
+                everything else is shared with the new heap.
+            """
+
+            if a is None:
+                return b
+            if b is None:
+                return a
+            if b.x < a.x:
+                a, b = b, a
+
+            l, r = a.l, cls.union(a.r, b)
+            if l is None or l.rank < r.rank:
+                l, r = r, l
+            return cls(a.x, l, r)
+
+        def __iter__(self):
+            """Preorder traversal.
+
+            Uses an explicit stack rather than recursion, since the left spine
+                can be as long as the heap (e.g. when inserting in descending order).
+            """
+
+            stack = [ self ]
+            while stack:
+                node = stack.pop()
+                yield node.x
+                if node.r is not None:
+                    stack.append(node.r)
+                if node.l is not None:
+                    stack.append(node.l)
+
+    def __init__(self, root=None, size=0):
+        """Creates an empty heap. The arguments are used internally to create new versions."""
+
+        self._root = root
+        self._size = size
+
+    def minimum(self):
+        """Return minimum element in the heap."""
+
+        return self._root.x
+
+    def union(self, other):
+        """Return a new heap with the elements of both self and other. Neither is modified."""
+
+        return type(self)(self._Node.union(self._root, other._root), self._size + other._size)
+
+    def insert(self, x):
+        """Return a new heap with x added.
+
+        A node is created containing just the new element,
+            which is then merged with self using the union algorithm.
+        """
+
+        return type(self)(self._Node.union(self._root, self._Node(x)), self._size + 1)
+
+    def extract_min(self):
+        """Return the minimum element, and a new heap without it.
+
+        The two children of the root are merged together into the new heap
+            using the union algorithm.
+        """
+
+        root = self._root
+        return root.x, type(self)(self._Node.union(root.l, root.r), self._size - 1)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        if self._root is None:
+            return iter(())
+        return iter(self._root)
+
+    def __repr__(self):
+        return f'{type(self).__name__}{tuple(self)}'
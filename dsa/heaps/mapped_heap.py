@@ -0,0 +1,417 @@
+"""
+Implementation of a binary heap stored in a memory-mapped file.
+
+Operation    | Running time
+-------------|---------------------
+open/attach  | O(1)
+minimum      | O(1)
+insert       | O(log n) amortized (the file occasionally grows)
+extract_min  | O(log n) worst case
+
+The heap stores fixed-width (priority, id) records, so it can live directly in an
+    mmap instead of a Python list.
+Reopening a heap after a restart only maps the file, no rebuild is needed.
+Other processes can attach to the same file read-only in order to peek at the heap.
+
+Each insert or extract_min is applied atomically using a redo journal.
+The records it changes are first collected in memory, then written to the journal
+    together with the new length and a checksum, and only then to the records themselves.
+Finally the new length is committed to the header.
+If the writing process dies before the commit, the journal is replayed the next time
+    the heap is opened for writing, so the heap is never left half-updated.
+
+File layout:
+
+    offset 0    magic bytes
+    offset 8    header slot 0 (sequence number, length, crc32)
+    offset 32   header slot 1
+    offset 64   journal (sequence number, length, entry count, crc32)
+    offset 88   journal entries (position, record), at most JOURNAL_ENTRIES of them
+    offset 4096 records, RECORD.size bytes each
+
+Doctests:
+
+>>> import os, tempfile
+>>> path = os.path.join(tempfile.mkdtemp(), 'queue.heap')
+>>> with MappedBinaryHeap(path) as x:
+...     for i, p in enumerate([5, 3, 8, 1]):
+...         x.insert((p, i))
+...
+>>> with MappedBinaryHeap.attach(path) as y:
+...     y.minimum()
+...
+(1.0, 3)
+
+"""
+
+
+from contextlib import contextmanager
+import mmap
+import os
+import struct
+import zlib
+
+from dsa.heaps.binary_heap import BinaryHeap
+
+
+MAGIC = b'DSAHEAP2'
+RECORD = struct.Struct('<dq') # priority, id
+_SLOT = struct.Struct('<QQI') # sequence number, length, crc32 of the first two fields
+_SLOT_OFFSETS = (8, 32)
+_JOURNAL = struct.Struct('<QQII') # sequence number, length, entry count, crc32
+_JOURNAL_OFFSET = 64
+_ENTRY = struct.Struct('<Q' + RECORD.format[1:]) # position, record
+JOURNAL_ENTRIES = 128 # enough for any single heap operation, since the heap depth is < 64
+HEADER_SIZE = 4096
+
+
+class _MappedRecords:
+    """Sequence of fixed-width records backed by a memory-mapped file.
+
+    Supports just enough of the list interface for BinaryHeap to use it as its data.
+
+    The length of the sequence is kept in one of two header slots.
+    Each update writes the slot not holding the current length, together with a
+        higher sequence number and a checksum.
+    On open, the valid slot with the highest sequence number is used, so a write
+        torn by a crash leaves the previous length intact.
+
+    Changes made inside transaction() are buffered, then journaled and applied together.
+    Changes made outside a transaction each form a transaction of their own.
+    """
+
+    def __init__(self, path, writable, capacity=64, durable=False):
+        self._writable = writable
+        self._durable = durable
+        self._pending = None # buffered writes of the current transaction
+        self._pending_len = None
+        if writable and not os.path.exists(path):
+            self._create(path, capacity)
+
+        self._file = open(path, 'r+b' if writable else 'rb')
+        self._map = None
+        self._remap()
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not a heap file.')
+        self._seq, self._len = self._read_header()
+        if writable:
+            self._recover()
+
+    @staticmethod
+    def _create(path, capacity):
+        """Create a heap file with room for capacity records."""
+
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(bytes(HEADER_SIZE - len(MAGIC)))
+            f.write(bytes(capacity * RECORD.size))
+
+        with open(path, 'r+b') as f:
+            f.seek(_SLOT_OFFSETS[0])
+            f.write(_SLOT.pack(0, 0, zlib.crc32(struct.pack('<QQ', 0, 0))))
+
+    def _remap(self, size=None):
+        """(Re)map the file, first resizing it to size bytes if given."""
+
+        if self._map is not None:
+            self._map.close()
+        if size is not None:
+            self._file.truncate(size)
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def _capacity(self):
+        return (len(self._map) - HEADER_SIZE) // RECORD.size
+
+    def _read_header(self):
+        """Return (sequence number, length) from the newest valid header slot."""
+
+        best = None
+        for offset in _SLOT_OFFSETS:
+            seq, length, crc = _SLOT.unpack_from(self._map, offset)
+            if crc != zlib.crc32(struct.pack('<QQ', seq, length)):
+                continue # torn or never written
+            if best is None or seq > best[0]:
+                best = seq, length
+        if best is None:
+            raise ValueError('Heap file has no valid header.')
+        return best
+
+    def _commit(self, length):
+        """Record a new length in the inactive header slot."""
+
+        seq = self._seq + 1
+        crc = zlib.crc32(struct.pack('<QQ', seq, length))
+        _SLOT.pack_into(self._map, _SLOT_OFFSETS[seq % 2], seq, length, crc)
+        self._seq, self._len = seq, length
+
+    def _write_journal(self, writes, length):
+        """Write the changes of a transaction to the journal."""
+
+        if len(writes) > JOURNAL_ENTRIES:
+            raise ValueError('Transaction is too large for the journal.')
+
+        entries = b''.join(_ENTRY.pack(i, *x) for i, x in writes.items())
+        seq = self._seq + 1
+        crc = zlib.crc32(struct.pack('<QQI', seq, length, len(writes)) + entries)
+        start = _JOURNAL_OFFSET + _JOURNAL.size
+        self._map[start:start + len(entries)] = entries
+        _JOURNAL.pack_into(self._map, _JOURNAL_OFFSET, seq, length, len(writes), crc)
+
+    def _read_journal(self):
+        """Return (sequence number, length, writes) from the journal, or None if it is torn."""
+
+        seq, length, count, crc = _JOURNAL.unpack_from(self._map, _JOURNAL_OFFSET)
+        if count > JOURNAL_ENTRIES:
+            return None
+        start = _JOURNAL_OFFSET + _JOURNAL.size
+        entries = self._map[start:start + count * _ENTRY.size]
+        if crc != zlib.crc32(struct.pack('<QQI', seq, length, count) + entries):
+            return None
+
+        writes = {}
+        for i, *x in _ENTRY.iter_unpack(entries):
+            writes[i] = tuple(x)
+        return seq, length, writes
+
+    def _write_records(self, writes):
+        for i, x in writes.items():
+            RECORD.pack_into(self._map, HEADER_SIZE + i * RECORD.size, *x)
+
+    def _apply(self, writes, length):
+        """Journal, apply and commit the changes of a transaction."""
+
+        self._write_journal(writes, length)
+        if self._durable:
+            self._map.flush() # the journal must reach the disk before the records
+        self._write_records(writes)
+        self._commit(length)
+        if self._durable:
+            self._map.flush()
+
+    def _recover(self):
+        """Finish the last transaction, if a crash interrupted it after it was journaled.
+
+        Replaying is idempotent, so it does not matter how many records were written.
+        """
+
+        journal = self._read_journal()
+        if journal is None or journal[0] != self._seq + 1:
+            return # journal was torn, or was already committed
+        _, length, writes = journal
+        if HEADER_SIZE + length * RECORD.size > len(self._map):
+            self._remap(HEADER_SIZE + length * RECORD.size)
+        self._write_records(writes)
+        self._commit(length)
+        self._map.flush()
+
+    @contextmanager
+    def transaction(self):
+        """Buffer all changes made in the with block, then apply them atomically.
+
+        Nested transactions are merged into the outermost one.
+        If the block raises an exception, its changes are discarded.
+        """
+
+        if self._pending is not None:
+            yield
+            return
+
+        self._check_writable()
+        self._pending, self._pending_len = {}, self._len
+        try:
+            yield
+            writes, length = self._pending, self._pending_len
+        finally:
+            self._pending, self._pending_len = None, None
+        self._apply(writes, length)
+
+    def _check_writable(self):
+        if not self._writable:
+            raise TypeError('Heap is attached read-only.')
+
+    def _position(self, i):
+        if not isinstance(i, int):
+            raise TypeError(f'heap indices must be integers, not {type(i).__name__}')
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('heap index out of range')
+        return i
+
+    def __len__(self):
+        if self._pending is not None:
+            return self._pending_len
+        if not self._writable:
+            # another process may have changed the heap since we last looked.
+            self._seq, self._len = self._read_header()
+            if self._len > self._capacity():
+                self._remap() # file has grown
+        return self._len
+
+    def __getitem__(self, i):
+        i = self._position(i)
+        if self._pending is not None and i in self._pending:
+            return self._pending[i]
+        return RECORD.unpack_from(self._map, HEADER_SIZE + i * RECORD.size)
+
+    def __setitem__(self, i, x):
+        with self.transaction():
+            self._pending[self._position(i)] = tuple(x)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, x):
+        with self.transaction():
+            if self._pending_len == self._capacity():
+                # double capacity so that appends are amortized O(1).
+                self._remap(HEADER_SIZE + 2 * max(self._capacity(), 1) * RECORD.size)
+            self._pending[self._pending_len] = tuple(x)
+            self._pending_len += 1
+
+    def pop(self, i=-1):
+        with self.transaction():
+            if i not in (-1, self._pending_len - 1):
+                raise IndexError('only the last record can be popped')
+            x = self[-1]
+            self._pending_len -= 1
+            self._pending.pop(self._pending_len, None) # no need to journal it
+            return x
+
+    def clear(self):
+        with self.transaction():
+            self._pending.clear()
+            self._pending_len = 0
+
+    def count(self, x):
+        return sum(1 for y in self if y == tuple(x))
+
+    def index(self, x, *args):
+        return list(self).index(tuple(x), *args)
+
+    def __eq__(self, other):
+        if isinstance(other, _MappedRecords):
+            other = list(other)
+        return list(self) == other
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _unsupported(name):
+    """Return a method which rejects the list operation name."""
+
+    def method(self, *args, **kwargs):
+        raise TypeError(f'{type(self).__name__} does not support {name}')
+    method.__name__ = name
+    return method
+
+
+class MappedBinaryHeap(BinaryHeap):
+    """Binary heap of (priority, id) records kept in a memory-mapped file.
+
+    The heap logic is inherited unchanged from BinaryHeap,
+        only the underlying storage is replaced.
+    Priorities are stored as doubles, ids as signed 64 bit integers.
+
+    Only a single process should open the heap for writing.
+    Each insert and extract_min is atomic with respect to the writing process crashing,
+        as long as the heap is reopened for writing afterwards (see the module docstring).
+    Processes attached read-only may see an operation half-way through,
+        and do not replay the journal themselves.
+
+    Changes reach the file through the shared mapping, which survives the process dying
+        but not the machine losing power.
+    With durable=True, the mapping is flushed to disk twice per operation
+        (journal first, then records), which makes operations atomic across power failures too.
+    Otherwise call flush() to write changes to disk.
+
+    Of the list operations inherited from UserList, only those which keep the heap order
+        are supported: len(), iteration, `in`, indexing by integer, count(), index(),
+        clear(), ==, and extend() (which inserts each record in turn).
+    Operations which would reorder or copy the records raise TypeError.
+    """
+
+    def __init__(self, path, readonly=False, capacity=64, durable=False):
+        """Open the heap stored at path, creating it if it does not exist.
+
+        capacity is the number of records initially allocated for a new file.
+        """
+
+        super().__init__()
+        self.data = _MappedRecords(path, writable=not readonly, capacity=capacity, durable=durable)
+
+    @classmethod
+    def attach(cls, path):
+        """Attach read-only to a heap another process is using."""
+
+        return cls(path, readonly=True)
+
+    def insert(self, x):
+        """Insert a (priority, id) record x into the heap, atomically."""
+
+        with self.data.transaction():
+            super().insert(x)
+
+    def extract_min(self):
+        """Remove and return the minimum record in the heap, atomically."""
+
+        with self.data.transaction():
+            return super().extract_min()
+
+    def extend(self, xs):
+        """Insert each of the records in xs.
+
+        Each insert is atomic on its own, but a crash may leave only some of xs inserted.
+        """
+
+        for x in xs:
+            self.insert(x)
+
+    # list operations which would break the heap order, or copy the heap into memory.
+    __delitem__ = _unsupported('del')
+    __add__ = _unsupported('+')
+    __radd__ = _unsupported('+')
+    __iadd__ = _unsupported('+=')
+    __mul__ = _unsupported('*')
+    __rmul__ = _unsupported('*')
+    __imul__ = _unsupported('*=')
+    __lt__ = _unsupported('<')
+    __le__ = _unsupported('<=')
+    __gt__ = _unsupported('>')
+    __ge__ = _unsupported('>=')
+    __copy__ = _unsupported('copy')
+    copy = _unsupported('copy')
+    remove = _unsupported('remove')
+    reverse = _unsupported('reverse')
+    sort = _unsupported('sort')
+
+    def flush(self):
+        """Write any changes to the heap back to disk."""
+
+        self.data.flush()
+
+    def close(self):
+        """Unmap the heap file."""
+
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
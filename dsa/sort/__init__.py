@@ -0,0 +1 @@
+from dsa.sort.adaptive import sort
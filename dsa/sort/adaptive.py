@@ -0,0 +1,113 @@
+"""Implementation of an adaptive sort, which probes its input to pick one of the other sorts."""
+
+from collections import namedtuple
+from numbers import Number
+from random import sample
+
+from dsa.sort.insertionsort import insertionsort
+from dsa.sort.mergesort import mergesort
+from dsa.sort.quicksort import quicksort
+from dsa.sort.shellsort import shellsort
+
+
+Thresholds = namedtuple('Thresholds', [
+    'small',        # inputs with at most this many elements are insertion sorted
+    'presorted',    # maximum disorder (see Probe) for input to count as nearly sorted
+    'swap_budget',  # swaps per element insertion sort may make on nearly sorted input
+    'duplicates',   # minimum duplicate ratio for which quicksort is used
+    'cuira',        # largest input shellsorted with the cuira gaps, tokuda is used above
+    'large',        # inputs with more elements than this are quicksorted instead of shellsorted
+    'sample_size',  # number of samples taken by the probe
+])
+
+DEFAULT_THRESHOLDS = Thresholds(
+    small=16, presorted=0.02, swap_budget=8, duplicates=0.5, cuira=4000, large=6000, sample_size=64,
+)
+
+
+# descents:    fraction of sampled adjacent pairs which are out of order (run structure).
+# inversions:  fraction of sampled pairs of random positions which are out of order.
+# duplicates:  fraction of sampled elements which are repeats of other sampled elements.
+# numeric:     whether all sampled elements are numbers.
+Probe = namedtuple('Probe', ['size', 'descents', 'inversions', 'duplicates', 'numeric'])
+
+# fallback is True if insertion sort was tried first, but gave up.
+# thresholds are the Thresholds the probe was compared against.
+SortReport = namedtuple('SortReport', ['algorithm', 'gap_seq', 'probe', 'fallback', 'thresholds'])
+
+
+def probe(xs, sample_size):
+    """Estimate properties of the list xs by looking at up to sample_size random positions.
+
+    Positions are sampled without replacement, so for lists with at most sample_size
+        elements the whole list is looked at.
+    Takes O(sample_size) time regardless of the length of xs.
+    """
+
+    n = len(xs)
+    if n < 2:
+        return Probe(n, 0.0, 0.0, 0.0, all(isinstance(x, Number) for x in xs))
+
+    pairs = sample(range(n-1), min(sample_size, n-1))
+    descents = sum(xs[i+1] < xs[i] for i in pairs) / len(pairs)
+
+    inversions = 0
+    for _ in range(sample_size):
+        i, j = sorted(sample(range(n), 2))
+        inversions += xs[j] < xs[i]
+    inversions /= sample_size
+
+    values = [ xs[i] for i in sample(range(n), min(sample_size, n)) ]
+    try:
+        duplicates = 1 - len(set(values)) / len(values)
+    except TypeError: # unhashable elements
+        duplicates = 0.0
+
+    return Probe(n, descents, inversions, duplicates, all(isinstance(x, Number) for x in values))
+
+
+def sort(xs, stable=False, thresholds=DEFAULT_THRESHOLDS):
+    """Sorts the list xs in place, using whichever sort in dsa.sort suits it best.
+
+    The input is probed (see probe()), then:
+        - small or nearly sorted input is insertion sorted,
+        - if a stable sort is required, mergesort is used,
+        - input with many duplicates is quicksorted, since its partitioning is three-way,
+        - large input is quicksorted,
+        - everything else is shellsorted, with a gap sequence chosen by size.
+    Whether the elements are numeric is reported, but it did not change the best choice
+        when the thresholds were tuned.
+
+    The probe only samples the input, so it can mistake input with a few far out of place
+        elements (e.g. a sorted list with a batch appended) for nearly sorted input.
+    Insertion sort takes quadratic time on such input, so it is given a budget of
+        swap_budget swaps per element, after which the remaining choices above are
+        made as if the input had not looked nearly sorted.
+    Insertion sort never reorders equal elements, so this keeps a stable sort stable.
+
+    Returns a SortReport saying which algorithm was used and why.
+    """
+
+    p = probe(xs, thresholds.sample_size)
+
+    if p.size <= thresholds.small:
+        insertionsort(xs)
+        return SortReport('insertionsort', None, p, False, thresholds)
+
+    fallback = False
+    if max(p.descents, p.inversions) <= thresholds.presorted:
+        if insertionsort(xs, max_swaps=thresholds.swap_budget * p.size):
+            return SortReport('insertionsort', None, p, False, thresholds)
+        fallback = True
+
+    if stable:
+        xs[:] = mergesort(xs)
+        return SortReport('mergesort', None, p, fallback, thresholds)
+
+    if p.duplicates >= thresholds.duplicates or p.size > thresholds.large:
+        quicksort(xs)
+        return SortReport('quicksort', None, p, fallback, thresholds)
+
+    gap_seq = 'cuira' if p.size <= thresholds.cuira else 'tokuda'
+    shellsort(xs, gap_seq)
+    return SortReport('shellsort', gap_seq, p, fallback, thresholds)
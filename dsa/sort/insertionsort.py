@@ -1,15 +1,26 @@
 """Implementation of insertion sort."""
 
-def insertionsort(xs):
+def insertionsort(xs, max_swaps=None):
     """Sorts the list xs in place using the insertion sort algorithm.
 
     Insertion sort scans the input list.
     For each item, it moves that item down in the list until it is greater than
         its predecessor.
+
+    Each swap removes exactly one inversion, so the number of swaps is the number of
+        inversions in xs.
+    If max_swaps is given, the sort gives up once that many swaps have been made,
+        leaving xs partially sorted and returning False.
+    Otherwise it returns True.
     """
 
+    swaps = 0
     for i in range(1, len(xs)):
         j = i
         while j > 0 and xs[j] < xs[j-1]:
+            if swaps == max_swaps:
+                return False
             xs[j], xs[j-1] = xs[j-1], xs[j]
             j -= 1
+            swaps += 1
+    return True
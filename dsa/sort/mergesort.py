@@ -1,18 +1,22 @@
 """Implementation of the mergesort algorithm."""
 
 def merge(xs, ys):
-    """Merges two sorted lists xs and ys into a third sorted list, returning the result."""
+    """Merges two sorted lists xs and ys into a third sorted list, returning the result.
+
+    Where elements of xs and ys are equal, those from xs come first.
+    This makes mergesort stable.
+    """
 
     zs = []
     i, j = 0, 0
 
     while i < len(xs) and j < len(ys):
-        if xs[i] < ys[j]:
-            zs.append(xs[i])
-            i += 1
-        else:
+        if ys[j] < xs[i]:
             zs.append(ys[j])
             j += 1
+        else:
+            zs.append(xs[i])
+            i += 1
 
     # add remaining elements in xs to zs
     zs += xs[i:]
@@ -0,0 +1,76 @@
+"""Implementation of the quicksort algorithm, and of incremental quicksort."""
+
+from random import randint
+
+
+def partition(xs, lo, hi):
+    """Partition xs[lo:hi] in place around a randomly chosen pivot.
+
+    Uses a three-way partition, so that runs of equal elements do not degrade
+        quicksort to quadratic time.
+    Returns (lt, gt) such that afterwards
+        xs[lo:lt] < pivot, xs[lt:gt] == pivot and xs[gt:hi] > pivot.
+    The elements in xs[lt:gt] are hence in their final sorted positions.
+    """
+
+    pivot = xs[randint(lo, hi-1)]
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        if xs[i] < pivot:
+            xs[lt], xs[i] = xs[i], xs[lt]
+            lt += 1
+            i += 1
+        elif pivot < xs[i]:
+            gt -= 1
+            xs[gt], xs[i] = xs[i], xs[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def quicksort(xs, lo=0, hi=None):
+    """Sorts the list xs in place using the quicksort algorithm.
+
+    Quicksort partitions the list around a pivot,
+        then recursively sorts the elements smaller and larger than the pivot.
+    Base cases occur when the sublist is empty or a singleton.
+    """
+
+    if hi is None:
+        hi = len(xs)
+    if hi - lo <= 1:
+        return
+
+    lt, gt = partition(xs, lo, hi)
+    quicksort(xs, lo, lt)
+    quicksort(xs, gt, hi)
+
+
+def sorted_iter(xs):
+    """Generator yielding the elements of xs in sorted order.
+
+    Uses incremental quicksort, which only does the partitioning work needed
+        for the elements consumed so far.
+    A stack holds the pivot blocks found by partitioning, the topmost being the
+        one closest to the next element to be yielded.
+    Everything between the next element and the topmost pivot block is unsorted,
+        so it is partitioned again until the next element is part of a pivot block.
+    Taking the first k elements costs O(n + k log k) expected time,
+        consuming the whole generator costs O(n log n).
+
+    xs is not modified, the generator works on a copy.
+    """
+
+    xs = list(xs)
+    stack = [ (len(xs), len(xs)) ] # sentinel
+    i = 0
+    while i < len(xs):
+        lt, gt = stack[-1]
+        if i == lt:
+            # elements in the pivot block are in their final positions.
+            stack.pop()
+            while i < gt:
+                yield xs[i]
+                i += 1
+        else:
+            stack.append(partition(xs, i, lt))
@@ -63,6 +63,6 @@ def shellsort(xs, gap_seq='cuira'):
     for gap in GAPS[gap_seq]:
         for i in range(gap, len(xs)):
             j = i
-            while j > 0 and xs[j] < xs[j-gap]:
+            while j >= gap and xs[j] < xs[j-gap]:
                 xs[j], xs[j-gap] = xs[j-gap], xs[j]
                 j -= gap
@@ -0,0 +1,322 @@
+"""
+Implementation of a sorted list with order statistics.
+
+Operation    | Running time
+-------------|---------------------
+add          | O(log n + load + n/load**2) amortized
+remove       | O(log n + load + n/load**2) amortized
+index        | O(log n + log load)
+getitem      | O(log n)
+irange       | O(log n + k) for k elements
+update       | O(n log n)
+
+The elements are kept in a list of sorted chunks, each holding roughly load elements.
+The maximum of each chunk is kept in a separate list,
+    so the chunk an element belongs in can be found by bisection.
+A Fenwick tree (binary indexed tree) over the chunk lengths maps ranks to chunks
+    and back in O(log n) time.
+Chunks which grow past twice the load are split in two,
+    chunks which shrink below half the load are merged with a neighbour.
+
+Inserting into or deleting from a chunk costs O(load).
+A split or merge costs O(n/load), since it inserts into or deletes from the list
+    of chunks and rebuilds the Fenwick tree, but it only happens once every Omega(load)
+    adds or removes, hence the n/load**2 amortized term.
+With the default load of 500 this term is negligible for any list that fits in memory.
+
+Doctests:
+
+>>> x = SortedList([83, 38, 27, 29, 98, 93, 67, 85, 5, 76, 88, 9])
+>>> x.add(50)
+>>> x[0], x[5], x[-1]
+(5, 50, 98)
+>>> x.index(76)
+7
+>>> list(x.irange(30, 80))
+[38, 50, 67, 76]
+
+"""
+
+
+from bisect import bisect_left, bisect_right, insort
+
+from dsa.sort.mergesort import merge, mergesort
+
+
+class SortedList:
+    """Implementation of a sorted list.
+
+    The key is the value itself.
+    """
+
+    DEFAULT_LOAD = 500
+
+    def __init__(self, iterable=(), load=DEFAULT_LOAD):
+        """Creates a sorted list containing the elements of iterable.
+
+        load is the desired number of elements per chunk.
+        """
+
+        self._load = load
+        self._lists = [] # sorted chunks
+        self._maxes = [] # maximum element of each chunk
+        self._index = [ 0 ] # Fenwick tree over chunk lengths, 1-based
+        self._len = 0
+        self.update(iterable)
+
+    def _build_index(self):
+        """Rebuild the Fenwick tree from scratch in O(number of chunks) time.
+
+        Needed whenever chunks are created or destroyed.
+        """
+
+        index = [ 0 ] + [ len(chunk) for chunk in self._lists ]
+        for i in range(1, len(index)):
+            j = i + (i & -i)
+            if j < len(index):
+                index[j] += index[i]
+        self._index = index
+
+    def _index_add(self, i, delta):
+        """Add delta to the length of chunk i in the Fenwick tree."""
+
+        i += 1
+        while i < len(self._index):
+            self._index[i] += delta
+            i += i & -i
+
+    def _offset(self, i):
+        """Return the number of elements in the chunks before chunk i."""
+
+        total = 0
+        while i > 0:
+            total += self._index[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, rank):
+        """Return (chunk, position in chunk) for the element with the given rank.
+
+        Descends the Fenwick tree, skipping over chunks while they hold
+            no more elements than the remaining rank.
+        """
+
+        i = 0
+        bit = 1 << (len(self._index) - 1).bit_length()
+        while bit:
+            if i + bit < len(self._index) and self._index[i + bit] <= rank:
+                i += bit
+                rank -= self._index[i]
+            bit >>= 1
+        return i, rank
+
+    def _split(self, i):
+        """Split chunk i in two."""
+
+        chunk = self._lists[i]
+        self._lists.insert(i + 1, chunk[self._load:])
+        del chunk[self._load:]
+        self._maxes.insert(i, chunk[-1])
+        self._build_index()
+
+    def _delete(self, i, pos):
+        """Delete the element at position pos of chunk i."""
+
+        chunk = self._lists[i]
+        del chunk[pos]
+        self._len -= 1
+
+        if not chunk:
+            del self._lists[i]
+            del self._maxes[i]
+            self._build_index()
+            return
+
+        self._maxes[i] = chunk[-1]
+        if len(chunk) >= self._load // 2 or len(self._lists) == 1:
+            self._index_add(i, -1)
+            return
+
+        # merge the chunk with its successor, or its predecessor if it is the last one.
+        i = min(i, len(self._lists) - 2)
+        self._lists[i] += self._lists[i + 1]
+        self._maxes[i] = self._maxes[i + 1]
+        del self._lists[i + 1]
+        del self._maxes[i + 1]
+        if len(self._lists[i]) > 2 * self._load:
+            self._split(i)
+        else:
+            self._build_index()
+
+    def update(self, iterable):
+        """Add all the elements of iterable.
+
+        The new elements are sorted using mergesort, then merged with the existing ones,
+            and the chunks are rebuilt from the result.
+        """
+
+        values = mergesort(list(iterable))
+        if not values:
+            return
+        if self._len:
+            values = merge(list(self), values)
+
+        self._lists = [ values[i:i + self._load] for i in range(0, len(values), self._load) ]
+        self._maxes = [ chunk[-1] for chunk in self._lists ]
+        self._len = len(values)
+        self._build_index()
+
+    def add(self, x):
+        """Insert x, after any elements equal to it."""
+
+        if not self._lists:
+            self._lists.append([ x ])
+            self._maxes.append(x)
+            self._len = 1
+            self._build_index()
+            return
+
+        i = bisect_right(self._maxes, x)
+        if i == len(self._maxes):
+            # x is the largest element
+            i -= 1
+            self._lists[i].append(x)
+            self._maxes[i] = x
+        else:
+            insort(self._lists[i], x)
+        self._len += 1
+
+        if len(self._lists[i]) > 2 * self._load:
+            self._split(i)
+        else:
+            self._index_add(i, 1)
+
+    def discard(self, x):
+        """Remove an element equal to x, if there is one."""
+
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return False
+        pos = bisect_left(self._lists[i], x)
+        if self._lists[i][pos] != x:
+            return False
+        self._delete(i, pos)
+        return True
+
+    def remove(self, x):
+        """Remove an element equal to x, raising ValueError if there is none."""
+
+        if not self.discard(x):
+            raise ValueError(f'{x!r} not in list')
+
+    def _normalize(self, rank):
+        if not isinstance(rank, int):
+            raise TypeError(f'ranks must be integers, not {type(rank).__name__}')
+        if rank < 0:
+            rank += self._len
+        if not 0 <= rank < self._len:
+            raise IndexError('list index out of range')
+        return rank
+
+    def pop(self, rank=-1):
+        """Remove and return the element with the given rank (by default the largest)."""
+
+        i, pos = self._locate(self._normalize(rank))
+        x = self._lists[i][pos]
+        self._delete(i, pos)
+        return x
+
+    def __getitem__(self, rank):
+        """Return the element with the given rank, or a list of elements for a slice."""
+
+        if isinstance(rank, slice):
+            start, stop, step = rank.indices(self._len)
+            if step == 1:
+                return list(self.islice(start, stop))
+            return [ self[i] for i in range(start, stop, step) ]
+
+        i, pos = self._locate(self._normalize(rank))
+        return self._lists[i][pos]
+
+    def __delitem__(self, rank):
+        self.pop(rank)
+
+    def bisect_left(self, x):
+        """Return the number of elements less than x."""
+
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_left(self._lists[i], x)
+
+    def bisect_right(self, x):
+        """Return the number of elements less than or equal to x."""
+
+        i = bisect_right(self._maxes, x)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_right(self._lists[i], x)
+
+    def index(self, x):
+        """Return the rank of the first element equal to x, raising ValueError if there is none."""
+
+        rank = self.bisect_left(x)
+        if rank == self._len or self[rank] != x:
+            raise ValueError(f'{x!r} not in list')
+        return rank
+
+    def count(self, x):
+        """Return the number of elements equal to x."""
+
+        return self.bisect_right(x) - self.bisect_left(x)
+
+    def islice(self, start=0, stop=None):
+        """Iterate over the elements with ranks in [start, stop).
+
+        start and stop are interpreted the same way as in slices,
+            i.e. negative values count from the end and out of range values are clamped.
+        """
+
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if start >= stop:
+            return
+        i, pos = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._lists[i][pos:pos + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            i, pos = i + 1, 0
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Iterate over the elements between minimum and maximum.
+
+        A bound of None means the range is unbounded on that side.
+        inclusive says whether elements equal to minimum and maximum are included.
+        """
+
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        return self.islice(start, stop)
+
+    def __contains__(self, x):
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return False
+        return self._lists[i][bisect_left(self._lists[i], x)] == x
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._lists:
+            yield from chunk
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
@@ -0,0 +1,62 @@
+"""Tests for dsa.heaps.binomial_heap.BinomialHeap."""
+
+import random
+
+from dsa.heaps.binomial_heap import BinomialHeap
+
+
+def random_heap(minimum: int, maximum: int, n: int):
+    """Return a random heap with n elements in the range [minimum, maximum]."""
+
+    vals = random.sample(range(minimum, maximum), n)
+
+    x = BinomialHeap()
+    for i in vals:
+        x.insert(i)
+    return x, vals
+
+
+def test_minimum():
+    x, vals = random_heap(-1000, 1000, 500)
+    assert x.minimum() == min(*vals)
+
+
+def test_extract_min():
+    x, vals = random_heap(-1000, 1000, 500)
+
+    for i in sorted(vals):
+        assert x.minimum() == i
+        assert x.extract_min() == i
+
+
+def test_duplicates():
+    vals = [ random.randint(0, 5) for _ in range(500) ]
+    x = BinomialHeap.from_iterable(vals)
+
+    assert [ x.extract_min() for _ in vals ] == sorted(vals)
+
+
+def test_union():
+    x, xs = random_heap(-1000, 0, 300)
+    y, ys = random_heap(0, 1000, 200)
+    x.union(y)
+
+    for i in sorted(xs + ys):
+        assert x.extract_min() == i
+
+
+def test_decrease_key():
+    x, vals = random_heap(0, 1000, 100)
+    expected = list(vals)
+
+    node = x._trees[-1].lchild
+    expected.remove(node.x)
+    expected.append(-1)
+    x.decrease_key(node, -1)
+    assert x.minimum() == -1
+
+    node = x._trees[-1].lchild
+    expected.remove(node.x)
+    x.remove(node)
+    assert x.minimum() == min(expected)
+    assert [ x.extract_min() for _ in expected ] == sorted(expected)
@@ -0,0 +1,66 @@
+"""Tests for dsa.heaps.leftist_heap.LeftistHeap."""
+
+import random
+
+from dsa.heaps.leftist_heap import LeftistHeap
+
+
+def random_heap(minimum: int, maximum: int, n: int):
+    """Return a random heap with n elements in the range [minimum, maximum]."""
+
+    vals = random.sample(range(minimum, maximum), n)
+
+    x = LeftistHeap()
+    for i in vals:
+        x = x.insert(i)
+    return x, vals
+
+
+def drain(heap: LeftistHeap):
+    """Return all the elements of heap, in the order extract_min produces them."""
+
+    xs = []
+    while len(heap) > 0:
+        x, heap = heap.extract_min()
+        xs.append(x)
+    return xs
+
+
+def test_minimum():
+    x, vals = random_heap(-1000, 1000, 500)
+    assert x.minimum() == min(*vals)
+
+
+def test_extract_min():
+    x, vals = random_heap(-1000, 1000, 500)
+    assert drain(x) == sorted(vals)
+
+
+def test_union():
+    x, xs = random_heap(-1000, 0, 300)
+    y, ys = random_heap(0, 1000, 200)
+
+    assert drain(x.union(y)) == sorted(xs + ys)
+    assert drain(y.union(x)) == sorted(xs + ys)
+
+
+def test_persistence():
+    x, vals = random_heap(-1000, 1000, 200)
+    snapshot = x
+
+    y = x.insert(-5000)
+    for _ in range(100):
+        _, x = x.extract_min()
+
+    assert drain(snapshot) == sorted(vals)
+    assert drain(x) == sorted(vals)[100:]
+    assert drain(y) == [ -5000 ] + sorted(vals)
+
+
+def test_iter_long_left_spine():
+    x = LeftistHeap()
+    for i in range(3000, 0, -1):
+        x = x.insert(i)
+
+    assert sorted(x) == list(range(1, 3001))
+    assert repr(x).startswith('LeftistHeap(1, 2, 3')
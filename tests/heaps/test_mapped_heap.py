@@ -0,0 +1,154 @@
+"""Tests for dsa.heaps.mapped_heap.MappedBinaryHeap."""
+
+import random
+import struct
+
+import pytest
+
+from dsa.heaps.mapped_heap import MappedBinaryHeap, _MappedRecords, _SLOT_OFFSETS
+
+
+def random_heap(path, n: int):
+    """Return a mapped heap at path with n random records, and the records."""
+
+    vals = [ (float(p), i) for i, p in enumerate(random.sample(range(-1000, 1000), n)) ]
+
+    x = MappedBinaryHeap(path, capacity=4)
+    for v in vals:
+        x.insert(v)
+    return x, vals
+
+
+def test_extract_min(tmp_path):
+    x, vals = random_heap(tmp_path / 'heap', 500)
+
+    assert len(x) == len(vals)
+    for v in sorted(vals):
+        assert x.minimum() == v
+        assert x.extract_min() == v
+    assert len(x) == 0
+    x.close()
+
+
+def test_reopen(tmp_path):
+    path = tmp_path / 'heap'
+    x, vals = random_heap(path, 200)
+    for _ in range(50):
+        x.extract_min()
+    x.flush()
+    x.close()
+
+    with MappedBinaryHeap(path) as y:
+        assert len(y) == 150
+        assert [ y.extract_min() for _ in range(150) ] == sorted(vals)[50:]
+
+
+def test_attach(tmp_path):
+    path = tmp_path / 'heap'
+    x, vals = random_heap(path, 10)
+
+    with MappedBinaryHeap.attach(path) as reader:
+        assert reader.minimum() == min(vals)
+
+        # the reader sees later changes, including ones that grow the file.
+        for i in range(100):
+            x.insert((-2000.0, 1000 + i))
+        assert len(reader) == 110
+        assert reader.minimum()[0] == -2000.0
+
+        with pytest.raises(TypeError):
+            reader.insert((0.0, 0))
+    x.close()
+
+
+def test_torn_header(tmp_path):
+    path = tmp_path / 'heap'
+    x, _ = random_heap(path, 10)
+    x.close()
+
+    # 10 inserts committed sequence numbers 1..10, the last one is in slot 0.
+    with open(path, 'r+b') as f:
+        f.seek(_SLOT_OFFSETS[0])
+        f.write(b'\xff' * 4)
+
+    # the last insert is still in the journal, so it is replayed.
+    with MappedBinaryHeap(path) as y:
+        assert len(y) == 10
+
+
+class Crash(Exception):
+    pass
+
+
+write_records = _MappedRecords._write_records
+
+
+def crash_after_first_write(self, writes):
+    """Stand-in for _MappedRecords._write_records which dies part way through."""
+
+    i, x = next(iter(writes.items()))
+    write_records(self, { i: x })
+    raise Crash()
+
+
+@pytest.mark.parametrize('operation', [ 'insert', 'extract_min' ])
+def test_crash_recovery(tmp_path, monkeypatch, operation):
+    path = tmp_path / 'heap'
+    x, vals = random_heap(path, 100)
+    expected = sorted(vals)
+    if operation == 'insert':
+        expected = sorted(vals + [ (-5000.0, 1000) ])
+    else:
+        expected = expected[1:]
+
+    monkeypatch.setattr(_MappedRecords, '_write_records', crash_after_first_write)
+    with pytest.raises(Crash):
+        if operation == 'insert':
+            x.insert((-5000.0, 1000))
+        else:
+            x.extract_min()
+    monkeypatch.undo()
+    x.close()
+
+    with MappedBinaryHeap(path) as y:
+        assert len(y) == len(expected)
+        assert [ y.extract_min() for _ in expected ] == expected
+
+
+def test_failed_operation_discarded(tmp_path):
+    path = tmp_path / 'heap'
+    x, vals = random_heap(path, 10)
+
+    with pytest.raises(struct.error):
+        x.insert((1.0, 'id')) # ids must be integers
+    x.close()
+
+    with MappedBinaryHeap(path) as y:
+        assert [ y.extract_min() for _ in vals ] == sorted(vals)
+
+
+def test_list_operations(tmp_path):
+    x, vals = random_heap(tmp_path / 'heap', 10)
+
+    assert x.count(vals[0]) == 1 and x.count((5000.0, 0)) == 0
+    assert x[x.index(vals[3])] == vals[3]
+    assert x == list(x) and x != sorted(vals, reverse=True)
+
+    more = [ (-5000.0 + i, 100 + i) for i in range(20) ]
+    x.extend(more)
+    assert len(x) == 30
+    assert x.minimum() == (-5000.0, 100)
+
+    for op in [ lambda: x.sort(), lambda: x.reverse(), lambda: x.remove(vals[0]),
+                lambda: x.copy(), lambda: x + [], lambda: x < [], lambda: x[1:3] ]:
+        with pytest.raises(TypeError):
+            op()
+    with pytest.raises(TypeError):
+        del x[0]
+
+    x.clear()
+    assert len(x) == 0
+    x.close()
+
+    with MappedBinaryHeap(tmp_path / 'heap') as y:
+        assert len(y) == 0
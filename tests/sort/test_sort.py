@@ -8,9 +8,13 @@ from dsa.sort.bubblesort import bubblesort
 from dsa.sort.insertionsort import insertionsort
 from dsa.sort.selectionsort import selectionsort
 from dsa.sort.shellsort import shellsort
+from dsa.sort.quicksort import quicksort, sorted_iter
 
 from dsa.sort.mergesort import mergesort
 
+from dsa.sort import sort
+from dsa.sort.adaptive import DEFAULT_THRESHOLDS, probe
+
 
 def is_sorted(xs) -> bool:
     """Check if the given list xs is sorted"""
@@ -54,9 +58,100 @@ def monkeypatch_pure_sort(sort):
     setattr(sys.modules[__name__], f'test_{sort.__name__}', test_sort)
 
 
-for inplace_sort in [ bubblesort, insertionsort, selectionsort, shellsort ]:
+for inplace_sort in [ bubblesort, insertionsort, selectionsort, shellsort, quicksort, sort ]:
     monkeypatch_inplace_sort(inplace_sort)
 
 
 for pure_sort in [ mergesort ]:
     monkeypatch_pure_sort(pure_sort)
+
+
+def test_quicksort_duplicates():
+    xs = [ random.randint(0, 3) for _ in range(5000) ]
+    quicksort(xs)
+    assert is_sorted(xs)
+
+
+def test_sorted_iter():
+    MIN, MAX = -10000, 10000
+    for size in [0, 1, 5, 10, 100, 1000, 5000]:
+        xs = random.sample(range(MIN, MAX), size)
+        ys = list(xs)
+        assert list(sorted_iter(xs)) == sorted(xs)
+        assert xs == ys # input is not modified
+
+
+def test_sorted_iter_prefix():
+    xs = [ random.randint(-100, 100) for _ in range(5000) ]
+    it = sorted_iter(xs)
+    assert [ next(it) for _ in range(100) ] == sorted(xs)[:100]
+
+
+def test_mergesort_stable():
+    xs = [ (random.randint(0, 10), i) for i in range(1000) ]
+
+    class Key(tuple):
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+    assert mergesort([ Key(x) for x in xs ]) == sorted(xs, key=lambda x: x[0])
+
+
+def test_sort_dispatch():
+    assert sort(list(range(10, 0, -1))).algorithm == 'insertionsort'
+    assert sort(list(range(5000))).algorithm == 'insertionsort'
+
+    xs = random.sample(range(10000), 2000)
+    assert sort(list(xs), stable=True).algorithm == 'mergesort'
+    assert sort([ x % 4 for x in xs ]).algorithm == 'quicksort'
+    report = sort(list(xs))
+    assert (report.algorithm, report.gap_seq) == ('shellsort', 'cuira')
+
+    report = sort(list(xs), thresholds=DEFAULT_THRESHOLDS._replace(cuira=1000))
+    assert report.gap_seq == 'tokuda'
+
+    assert sort(random.sample(range(10**6), 10000)).algorithm == 'quicksort'
+    thresholds = DEFAULT_THRESHOLDS._replace(large=1000)
+    report = sort(list(xs), thresholds=thresholds)
+    assert report.algorithm == 'quicksort'
+    assert report.thresholds == thresholds
+    assert sort(list(xs)).thresholds == DEFAULT_THRESHOLDS
+    assert report.probe.size == 2000 and report.probe.numeric
+
+
+def test_probe_distinct():
+    for size in [20, 50, 64, 1000]:
+        xs = random.sample(range(10**6), size)
+        assert probe(xs, DEFAULT_THRESHOLDS.sample_size).duplicates == 0.0
+        assert sort(xs).algorithm != 'quicksort'
+
+
+def test_sort_appended_batch():
+    """A sorted prefix with a batch appended looks nearly sorted to the probe."""
+
+    batch = random.sample(range(20000), 100)
+    ys = sorted(list(range(20000)) + batch)
+
+    xs = list(range(20000)) + batch
+    report = sort(xs)
+    assert xs == ys
+    assert report.algorithm == 'quicksort'
+
+    # even when forced to try insertion sort first, it gives up and falls back.
+    xs = list(range(20000)) + batch
+    report = sort(xs, thresholds=DEFAULT_THRESHOLDS._replace(presorted=1.0))
+    assert xs == ys
+    assert report.fallback and report.algorithm == 'quicksort'
+
+
+def test_sort_fallback_stable():
+    class Key(tuple):
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+    xs = [ Key((i // 3, i)) for i in range(3000) ] + [ Key((random.randint(0, 999), -i)) for i in range(100) ]
+    ys = sorted(xs, key=lambda x: x[0])
+
+    report = sort(xs, stable=True, thresholds=DEFAULT_THRESHOLDS._replace(presorted=1.0))
+    assert report.fallback and report.algorithm == 'mergesort'
+    assert xs == ys
@@ -0,0 +1,88 @@
+"""Tests for dsa.sorted_containers.sorted_list.SortedList."""
+
+import bisect
+import random
+
+import pytest
+
+from dsa.sorted_containers.sorted_list import SortedList
+
+
+def random_sorted_list(n: int, load: int=8):
+    """Return a sorted list built from n random elements, and a sorted python list of them."""
+
+    vals = [ random.randint(-100, 100) for _ in range(n) ]
+    return SortedList(vals, load=load), sorted(vals)
+
+
+def test_update():
+    x, vals = random_sorted_list(1000)
+    more = [ random.randint(-100, 100) for _ in range(500) ]
+    x.update(more)
+
+    assert list(x) == sorted(vals + more)
+    assert len(x) == 1500
+
+
+def test_add_remove():
+    x, vals = random_sorted_list(0)
+
+    for _ in range(5000):
+        v = random.randint(-100, 100)
+        if random.random() < 0.6:
+            x.add(v)
+            bisect.insort(vals, v)
+        elif v in vals:
+            assert v in x
+            x.remove(v)
+            vals.remove(v)
+        else:
+            assert v not in x
+            with pytest.raises(ValueError):
+                x.remove(v)
+    assert list(x) == vals
+
+
+def test_rank():
+    x, vals = random_sorted_list(1000)
+
+    for rank in range(-len(vals), len(vals)):
+        assert x[rank] == vals[rank]
+    for v in vals:
+        assert x.index(v) == vals.index(v)
+        assert x.count(v) == vals.count(v)
+    with pytest.raises(IndexError):
+        x[len(vals)]
+
+
+def test_pop():
+    x, vals = random_sorted_list(500)
+
+    while vals:
+        rank = random.randrange(len(vals))
+        assert x.pop(rank) == vals.pop(rank)
+        assert len(x) == len(vals)
+    assert list(x) == []
+
+
+def test_irange():
+    x, vals = random_sorted_list(1000)
+
+    assert list(x.irange(-10, 10)) == [ v for v in vals if -10 <= v <= 10 ]
+    assert list(x.irange(-10, 10, (False, False))) == [ v for v in vals if -10 < v < 10 ]
+    assert list(x.irange(maximum=0)) == [ v for v in vals if v <= 0 ]
+    assert list(x.islice(100, 200)) == vals[100:200]
+
+
+def test_slices():
+    x = SortedList(range(1000), load=8)
+    vals = list(range(1000))
+
+    for start, stop in [ (-5, None), (0, -1), (-20, -10), (990, 2000), (-2000, 3), (500, 100) ]:
+        assert list(x.islice(start, stop)) == vals[start:stop]
+        assert x[start:stop] == vals[start:stop]
+    assert x[::7] == vals[::7]
+    assert x[-10::-3] == vals[-10::-3]
+
+    with pytest.raises(TypeError):
+        x['a']